@@ -3,15 +3,16 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import sys
 import io
-from contextlib import redirect_stdout
 
 # JF 언어 인터프리터 관련 모듈 임포트
 from lexer import Lexer
-from parser import Parser
+from parser import PrattParser
 from interpreter import Interpreter
+from session import SessionStore, is_valid_session_id
 
 app = Flask(__name__)
 CORS(app) # 모든 도메인에서의 요청을 허용 (개발 편의를 위해)
+sessions = SessionStore() # 편집 세션별 체크포인트 (바뀐 부분부터 다시 실행하기 위해)
 
 @app.route('/run', methods=['POST'])
 def run_code():
@@ -23,21 +24,32 @@ def run_code():
     code = data['code']
     user_inputs_text = data.get('inputs', '')
     input_list = user_inputs_text.split('\n')
-    # print() 함수의 출력을 가로채기 위한 설정
+    # console.print의 출력을 받을 이 요청만의 버퍼
+    # (sys.stdout을 바꾸는 redirect_stdout은 동시에 들어온 요청끼리 출력이 섞이므로 쓰지 않음)
     output_buffer = io.StringIO()
     
     try:
-        with redirect_stdout(output_buffer):
+        session_id = data.get('session_id')
+        if is_valid_session_id(session_id):
+            # 같은 세션의 이전 실행과 비교해, 바뀌지 않은 앞부분은 다시 파싱/실행하지 않고 이어서 처리
+            session = sessions.get(session_id)
+            with session.lock:
+                try:
+                    tree = session.parse(code)
+                    session.run(code, tree, input_list, output_buffer)
+                finally:
+                    sessions.trim() # 실행으로 늘어난 세션 메모리를 정리
+        else:
             # 1. Lexer -> Parser -> Interpreter 실행 파이프라인
             lexer = Lexer(code)
-            parser = Parser(lexer)
+            parser = PrattParser(lexer)
             tree = parser.parse()
-            
+
             # 새로운 인터프리터 인스턴스를 매번 생성하여 실행 환경 초기화
-            interpreter = Interpreter(inputs=input_list)
+            interpreter = Interpreter(inputs=input_list, output=output_buffer)
             interpreter.interpret(tree)
 
-        # 가로챈 출력 결과를 변수에 저장
+        # 버퍼에 모인 출력 결과를 변수에 저장
         output = output_buffer.getvalue()
         
         # 성공적으로 실행되면 출력 결과를 JSON으로 반환
@@ -14,7 +14,7 @@ class BuiltinType:
         self.name = name
         
 class Interpreter:
-    def __init__(self, inputs=[]):
+    def __init__(self, inputs=[], output=None):
         self.GLOBAL_SCOPE = {
             # 내장 객체 및 함수를 미리 정의
             'console': {
@@ -27,6 +27,18 @@ class Interpreter:
 
         self.inputs = inputs
         self.input_index = 0
+        # console.print의 출력 대상. None이면 sys.stdout에 씁니다.
+        # 여러 요청이 동시에 실행될 때 출력이 섞이지 않도록, 서버는 요청마다 자기 버퍼를 넘깁니다.
+        self.output = output
+
+    def snapshot(self):
+        """현재 실행 상태(변수, 읽은 입력 개수)를 복사해 돌려줍니다."""
+        return dict(self.GLOBAL_SCOPE), self.input_index
+
+    def restore(self, state):
+        """snapshot()으로 저장한 실행 상태로 되돌립니다."""
+        scope, self.input_index = state
+        self.GLOBAL_SCOPE = dict(scope)
 
     def visit(self, node):
         """
@@ -70,7 +82,7 @@ class Interpreter:
         if isinstance(callee, BuiltinFunction):
             func_name = callee.name
             if func_name == 'print':
-                print(*args)
+                print(*args, file=self.output)
                 return None
             elif func_name == 'read':
                 input_value = ""
@@ -1,4 +1,5 @@
 # lexer.py
+import re
 
 # --- 1. 토큰 타입 정의 ---
 INTEGER   = 'INTEGER'   # 숫자 (예: 10)
@@ -43,29 +44,85 @@ class Token:
     def __str__(self):
         return f'Token({self.type}, {repr(self.value)})'
 
+# 값이 항상 같은 토큰(키워드, 연산자, 줄바꿈)은 한 번만 만들어 두고 함께 씁니다.
+# 토큰은 만들어진 뒤 바뀌지 않으므로 안전하며, 큰 프로그램에서 객체 수가 크게 줄어듭니다.
+RESERVED_KEYWORDS = {
+    'is': Token(IS, 'is'), 'print': Token(PRINT, 'print'),
+    'true': Token(TRUE, True), 'false': Token(FALSE, False),
+    'and': Token(AND, 'and'), 'or': Token(OR, 'or'), 'not': Token(NOT, 'not'),
+}
+
+# 두 글자 연산자는 한 글자 연산자보다 먼저 확인합니다.
+DOUBLE_CHAR_TOKENS = {value: Token(type, value) for value, type in {'!=': NEQ, '>=': GTE, '<=': LTE}.items()}
+SINGLE_CHAR_TOKENS = {value: Token(type, value) for value, type in {
+    '=': EQ, '>': GT, '<': LT, '+': PLUS, '-': MINUS, '*': MUL, '/': DIV,
+    ',': COMMA, '(': LPAREN, ')': RPAREN, '.': DOT, ':': COLON,
+}.items()}
+NEWLINE_TOKEN = Token(NEWLINE, '\n')
+COMMENT_START = 'note:'
+
+WORD_PATTERN = re.compile(r'\w*')  # str.isalnum() 또는 '_' 인 글자들
+WHITESPACE_PATTERN = re.compile(r'[ \t\r]*')
+# 자주 나오는 토큰(ASCII 이름, 정수, 연산자, 줄바꿈)을 한 번에 찾는 패턴.
+# 여기에 맞지 않는 경우(문자열, 주석, 유니코드, 잘못된 글자 등)는 글자 단위 처리로 넘어갑니다.
+FAST_TOKEN_PATTERN = re.compile(r'''[ \t\r]*(?:
+    (?P<word>(?!n(?i:ote:))[A-Za-z_]\w*)
+  | (?P<number>[0-9]+)(?![.\w])
+  | (?P<op>!=|>=|<=|[=<>+\-*/,().:])
+  | (?P<newline>\n)
+)''', re.VERBOSE)
+# 문자열 안에서 따옴표, 이스케이프(\), 보간(@) 이외의 평범한 글자들
+STRING_TEXT_PATTERNS = {
+    '"': re.compile(r'[^"\\@]*'), '"""': re.compile(r'[^"\\@]*'), "'": re.compile(r"[^'\\@]*"),
+}
+
 # --- 2. Lexer 클래스 구현 ---
 class Lexer:
-    def __init__(self, text):
+    def __init__(self, text, pos=0):
         self.text = text         # 분석할 전체 코드
-        self.pos = 0             # 현재 분석 중인 위치
-        self.current_char = self.text[self.pos] if self.text else None # 현재 위치의 글자
+        self.pos = pos           # 현재 분석 중인 위치 (중간부터 다시 토큰화할 때는 0이 아님)
+        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None # 현재 위치의 글자
+        self.read_end = 0        # 현재 위치 너머로 엿본 가장 먼 위치 (이 위치 앞까지 읽음)
 
     def advance(self):
         """한 글자 앞으로 이동합니다."""
-        self.pos += 1
-        if self.pos < len(self.text):
-            self.current_char = self.text[self.pos]
+        self.move_to(self.pos + 1)
+
+    def move_to(self, pos):
+        """pos 위치로 바로 이동합니다. (여러 글자를 한 번에 건너뛸 때 사용)"""
+        self.pos = pos
+        if pos < len(self.text):
+            self.current_char = self.text[pos]
         else:
             self.current_char = None # 코드의 끝에 도달
 
     def peek(self):
         """다음 글자를 '엿보기'만 합니다. (위치 이동은 안 함)"""
         peek_pos = self.pos + 1
+        self.mark_read(peek_pos + 1)
         if peek_pos < len(self.text):
             return self.text[peek_pos]
         else:
             return None
 
+    def lookahead(self, length):
+        """현재 위치부터 length 글자를 '엿보기'만 합니다."""
+        self.mark_read(self.pos + length)
+        return self.text[self.pos:self.pos + length]
+
+    def mark_read(self, end):
+        """현재 위치 너머의 글자를 엿볼 때, 어디까지 읽었는지 기록합니다."""
+        if end > self.read_end:
+            self.read_end = end
+
+    def furthest_read(self):
+        """
+        지금까지 만든 토큰들이 의존하는 원문의 끝 위치.
+        이 위치 앞까지의 원문이 같다면 Lexer는 같은 토큰들을 만들어 냅니다.
+        (현재 위치의 글자는 항상 읽은 것으로 봅니다. 코드의 끝도 '끝이라는 사실'을 읽은 것입니다.)
+        """
+        return max(self.read_end, self.pos + 1)
+
     def skip_whitespace(self):
         """공백, 탭, 줄바꿈 등 의미 없는 문자들을 건너뜁니다."""
         while self.current_char is not None and self.current_char.isspace():
@@ -73,10 +130,11 @@ class Lexer:
 
     def number(self):
         """숫자를 읽습니다. 소수점과 정수를 구분하는 핵심 로직이 여기에 있습니다."""
-        result = ''
-        while self.current_char is not None and self.current_char.isdigit():
-            result += self.current_char
-            self.advance()
+        text, end = self.text, self.pos
+        while end < len(text) and text[end].isdigit():
+            end += 1
+        result = text[self.pos:end]
+        self.move_to(end)
         
         if self.current_char == '.' and self.peek() is not None and self.peek().isdigit():
             raise Exception("Float type is not yet supported.") # 소수점은 구현 안해서 오류 처리.
@@ -85,21 +143,16 @@ class Lexer:
 
     def _id(self):
         """키워드 인식 부분을 수정합니다."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char; self.advance()
-        
-        RESERVED_KEYWORDS = {
-            'is': Token(IS, 'is'), 'print': Token(PRINT, 'print'),
-            'true': Token(TRUE, True), 'false': Token(FALSE, False),
-            'and': Token(AND, 'and'), 'or': Token(OR, 'or'), 'not': Token(NOT, 'not'),
-        }
-        return RESERVED_KEYWORDS.get(result.lower(), Token(ID, result))
+        end = WORD_PATTERN.match(self.text, self.pos).end()
+        result = self.text[self.pos:end]
+        self.move_to(end)
+
+        return RESERVED_KEYWORDS.get(result.lower()) or Token(ID, result)
     
     def skip_comment(self):
         """'note:' 주석을 발견했을 때, 해당 줄의 끝까지 건너뛰는 메소드"""
-        while self.current_char is not None and self.current_char != '\n':
-            self.advance()
+        end = self.text.find('\n', self.pos)
+        self.move_to(end if end != -1 else len(self.text))
         self.skip_whitespace()
     
     def string(self):
@@ -109,7 +162,7 @@ class Lexer:
         
         # 시작 따옴표 확인 (", ', """)
         quote = self.current_char
-        if self.text[self.pos:self.pos+3] == '"""':
+        if self.lookahead(3) == '"""':
             quote = '"""'
             self.advance()
             self.advance()
@@ -117,9 +170,17 @@ class Lexer:
         else:
             self.advance() # 따옴표 한 칸 이동
 
+        plain_text = STRING_TEXT_PATTERNS[quote]
         while self.current_char is not None:
+            # 특별한 의미가 없는 글자들은 한 번에 읽습니다.
+            end = plain_text.match(self.text, self.pos).end()
+            if end > self.pos:
+                current_part += self.text[self.pos:end]
+                self.move_to(end)
+                continue
+
             # 종료 따옴표 확인
-            if quote == '"""' and self.text[self.pos:self.pos+3] == '"""':
+            if quote == '"""' and self.lookahead(3) == '"""':
                 self.advance(); self.advance(); self.advance()
                 break
             if self.current_char == quote and quote != '"""':
@@ -161,67 +222,60 @@ class Lexer:
 
     def skip_whitespace(self):
         """이제 줄바꿈(\n)은 건너뛰지 않습니다!"""
-        while self.current_char is not None and self.current_char in ' \t\r':
-            self.advance()
+        self.move_to(WHITESPACE_PATTERN.match(self.text, self.pos).end())
 
     def get_next_token(self):
         """
         호출될 때마다 코드에서 다음 토큰 하나를 찾아 반환합니다.
         """
+        match = FAST_TOKEN_PATTERN.match(self.text, self.pos)
+        if match is not None:
+            kind = match.lastgroup
+            # 주석 시작인지 확인하느라 토큰 시작부터 COMMENT_START 길이만큼 엿봤을 수 있습니다.
+            self.mark_read(match.start(kind) + len(COMMENT_START))
+            self.move_to(match.end())
+            value = match.group(kind)
+            if kind == 'word':
+                return RESERVED_KEYWORDS.get(value.lower()) or Token(ID, value)
+            if kind == 'number':
+                return Token(INTEGER, int(value))
+            if kind == 'op':
+                return DOUBLE_CHAR_TOKENS.get(value) or SINGLE_CHAR_TOKENS[value]
+            return NEWLINE_TOKEN
+
         while self.current_char is not None:
-            if self.current_char in ' \t\r':
+            char = self.current_char
+            if char in ' \t\r':
                 self.skip_whitespace()
                 continue
 
-            if self.current_char == '\n':
+            if char == '\n':
                 self.advance()
-                return Token(NEWLINE, '\n')
+                return NEWLINE_TOKEN
 
-            if self.current_char == 'n' and self.text[self.pos:self.pos + 5].lower() == 'note:':
+            if char == 'n' and self.lookahead(len(COMMENT_START)).lower() == COMMENT_START:
                 self.skip_comment()
                 continue
 
-            if self.current_char.isalpha() or self.current_char == '_':
+            if char.isalpha() or char == '_':
                 return self._id()
 
-            if self.current_char.isdigit():
+            if char.isdigit():
                 return Token(INTEGER, self.number())
             
-            if self.current_char in ('"', "'"):
+            if char in ('"', "'"):
                 return Token(STRING, self.string())
             
-            if self.current_char == '=': self.advance(); return Token(EQ, '=')
-            if self.current_char == '!' and self.peek() == '=': self.advance(); self.advance(); return Token(NEQ, '!=')
-            if self.current_char == '>' and self.peek() == '=': self.advance(); self.advance(); return Token(GTE, '>=')
-            if self.current_char == '<' and self.peek() == '=': self.advance(); self.advance(); return Token(LTE, '<=')
-            
-            if self.current_char == '>': self.advance(); return Token(GT, '>')
-            if self.current_char == '<': self.advance(); return Token(LT, '<')
-            if self.current_char == '+': self.advance(); return Token(PLUS, '+')
-            if self.current_char == '-': self.advance(); return Token(MINUS, '-')
-            if self.current_char == '*': self.advance(); return Token(MUL, '*')
-            if self.current_char == '/': self.advance(); return Token(DIV, '/')
-
-            if self.current_char == ',':
-                self.advance()
-                return Token(COMMA, ',')
-        
-            if self.current_char == '(':
-                self.advance()
-                return Token(LPAREN, '(')
-            
-            if self.current_char == ')':
-                self.advance()
-                return Token(RPAREN, ')')
-            
-            if self.current_char == '.':
-                self.advance()
-                return Token(DOT, '.')
-            
-            if self.current_char == ':':
+            token = DOUBLE_CHAR_TOKENS.get(self.lookahead(2))
+            if token is not None:
+                self.move_to(self.pos + 2)
+                return token
+
+            token = SINGLE_CHAR_TOKENS.get(char)
+            if token is not None:
                 self.advance()
-                return Token(COLON, ':')
+                return token
             
-            raise Exception(f"Invalid character: '{self.current_char}'")
+            raise Exception(f"Invalid character: '{char}'")
 
         return Token(EOF, None) # 코드의 끝에 도달하면 EOF 토큰 반환
\ No newline at end of file
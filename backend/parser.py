@@ -8,8 +8,13 @@ class ASTNode:
 
 class ProgramNode(ASTNode):
     """프로그램 전체를 나타내는 최상위 노드. 여러 개의 문장을 자식으로 가집니다."""
-    def __init__(self, statements):
+    def __init__(self, statements, statement_ends=None, line_starts=None):
         self.statements = statements
+        # 아래 두 값은 PrattParser만 채웁니다. (Session이 바뀐 부분만 다시 파싱/실행할 때 사용)
+        # 각 문장을 파싱하는 데 쓰인 원문의 끝 위치
+        self.statement_ends = statement_ends
+        # 줄의 첫 문장마다 (거기까지 파싱하는 데 쓰인 원문의 끝, 앞선 문장 수, 다시 토큰화를 시작할 위치)
+        self.line_starts = line_starts
 
 class VarDeclNode(ASTNode):
     """변수 선언문을 나타내는 노드. 예: x is int(10)."""
@@ -215,4 +220,170 @@ class Parser:
             elif self.current_token.type not in (NEWLINE, EOF):
                 raise Exception(f"Syntax Error: Unexpected token '{self.current_token.value}' at the end of a line.")
 
-        return ProgramNode(all_statements)
\ No newline at end of file
+        return ProgramNode(all_statements)
+
+# --- 3. Pratt(우선순위 테이블) 파서 ---
+
+# 이항 연산자의 결합력(binding power). 숫자가 클수록 먼저 묶입니다.
+# 새 이항 연산자는 여기에 한 줄 추가하는 것으로 충분합니다. (모두 좌결합)
+BINARY_PRECEDENCE = {
+    OR: 1,
+    AND: 2,
+    EQ: 3, NEQ: 3,
+    LT: 4, GT: 4, LTE: 4, GTE: 4,
+    PLUS: 5, MINUS: 5,
+    MUL: 6, DIV: 6,
+}
+
+# 전위(단항) 연산자. 피연산자는 다시 전위 연산자 또는 호출 표현식입니다.
+PREFIX_OPERATORS = {NOT}
+
+# 리터럴 토큰 -> 노드 생성 함수
+LITERAL_NODES = {
+    INTEGER: NumberNode,
+    STRING: lambda token: StringNode(token.value),
+    TRUE: BooleanNode,
+    FALSE: BooleanNode,
+    ID: VarAccessNode,
+}
+
+# primary 뒤에 이어질 수 있는 후위 표현(호출, 멤버 접근)의 시작 토큰
+POSTFIX_START = {LPAREN, DOT}
+
+
+class PrattParser(Parser):
+    """
+    소스 전체를 미리 토큰 배열로 만든 뒤, 우선순위 테이블을 보고 표현식을 파싱하는 파서.
+    Parser와 똑같은 ProgramNode와 오류 메시지를 만들어 내며, 문장(statement)/프로그램(parse)
+    단위의 처리는 Parser의 것을 그대로 사용합니다.
+    """
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.start_offset = lexer.pos
+        self.tokens = []
+        self.token_ends = []       # 각 토큰까지 만드는 데 Lexer가 읽은 원문의 끝 위치
+        self.token_offsets = []    # 각 토큰을 만든 직후 Lexer의 위치
+        self.statement_ends = []   # 각 문장을 파싱하는 데 쓰인 원문의 끝 위치
+        self.line_starts = []
+        self.lex_error = None
+        try:
+            while True:
+                token = lexer.get_next_token()
+                self.tokens.append(token)
+                self.token_ends.append(lexer.furthest_read())
+                self.token_offsets.append(lexer.pos)
+                if token.type == EOF: break
+            # EOF 뒤를 엿볼 때를 위한 여분의 EOF. 파서는 EOF를 소비하지 않으므로 배열 끝을 넘지 않습니다.
+            self.tokens.append(token)
+            self.token_ends.append(lexer.furthest_read())
+        except Exception as e:
+            # 기존 Parser는 토큰을 하나씩 미리 읽으므로, 잘못된 글자 오류는
+            # 파서가 그 토큰 바로 앞까지 왔을 때 발생합니다. 같은 시점에 다시 던집니다.
+            self.lex_error = e
+
+        self.pos = 0
+        self.current_token = self.token_at(0)
+        self.peek_token = self.token_at(1)
+
+    def token_at(self, index):
+        """배열에서 토큰을 꺼냅니다. 토큰화에 실패한 자리라면 그 오류를 던집니다."""
+        try:
+            return self.tokens[index]
+        except IndexError:
+            raise self.lex_error
+
+    def advance(self):
+        """종류를 이미 확인한 현재 토큰을 소비합니다."""
+        self.pos += 1
+        self.current_token = self.peek_token
+        try:
+            self.peek_token = self.tokens[self.pos + 1]
+        except IndexError:
+            raise self.lex_error
+
+    def eat(self, token_type):
+        if self.current_token.type == token_type:
+            self.advance()
+        else:
+            raise Exception(f"Syntax Error: Expected {token_type}, found {self.current_token.type}")
+
+    def primary(self):
+        """리터럴, 변수, 괄호 표현식"""
+        token = self.current_token
+        make_node = LITERAL_NODES.get(token.type)
+        if make_node is not None:
+            self.advance()
+            return make_node(token)
+        if token.type == LPAREN:
+            self.advance(); node = self.expr(); self.eat(RPAREN); return node
+        raise Exception("Syntax Error: Invalid primary expression")
+
+    def call(self):
+        return self.postfix(self.primary())
+
+    def postfix(self, node):
+        """node 뒤에 붙는 호출 '(...)'과 멤버 접근 '.name'을 처리합니다."""
+        while True:
+            token_type = self.current_token.type
+            if token_type == LPAREN:
+                self.advance()
+                args = []
+                if self.current_token.type != RPAREN:
+                    args.append(self.expr())
+                    while self.current_token.type == COMMA:
+                        self.advance()
+                        args.append(self.expr())
+                self.eat(RPAREN)
+                node = MethodCallNode(callee=node, args=args)
+            elif token_type == DOT and self.peek_token.type in (ID, PRINT):
+                self.advance()
+                member = self.current_token
+                self.advance()
+                node = MemberAccessNode(object=node, member=member)
+            else:
+                return node
+
+    def factor(self):
+        token = self.current_token
+        if token.type in PREFIX_OPERATORS:
+            self.advance()
+            return UnaryOpNode(op_token=token, expr=self.factor())
+        return self.call()
+
+    def expr(self, min_precedence=0):
+        """표현식 파싱의 시작점. min_precedence보다 강하게 묶이는 연산자만 소비합니다."""
+        token = self.current_token
+        make_node = LITERAL_NODES.get(token.type)
+        if make_node is not None:
+            # 리터럴·변수는 factor/call/primary를 거치지 않고 바로 노드로 만듭니다.
+            self.advance()
+            node = make_node(token)
+            if self.current_token.type in POSTFIX_START:
+                node = self.postfix(node)
+        else:
+            node = self.factor()
+        while True:
+            op_token = self.current_token
+            precedence = BINARY_PRECEDENCE.get(op_token.type)
+            if precedence is None or precedence <= min_precedence:
+                return node
+            self.advance()
+            node = BinOpNode(left=node, op_token=op_token, right=self.expr(precedence))
+
+    def statement(self):
+        """
+        문장을 파싱하면서, 그 결과에 영향을 준 원문의 끝 위치를 기록합니다.
+        파서는 현재 토큰과 그다음 토큰까지만 엿보므로, 그 토큰까지 만드는 데 Lexer가 읽은 원문이
+        같다면 이 문장의 AST도 같습니다. (Session이 바뀐 문장을 찾을 때 사용)
+        """
+        if self.pos == 0 or self.tokens[self.pos - 1].type == NEWLINE:
+            # 줄의 첫 문장: 여기서부터는 새 Lexer/PrattParser로 이어서 파싱할 수 있습니다.
+            offset = self.token_offsets[self.pos - 1] if self.pos else self.start_offset
+            self.line_starts.append((self.token_ends[self.pos + 1], len(self.statement_ends), offset))
+        node = super().statement()
+        self.statement_ends.append(self.token_ends[self.pos + 1])
+        return node
+
+    def parse(self):
+        tree = super().parse()
+        return ProgramNode(tree.statements, self.statement_ends, self.line_starts)
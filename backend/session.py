@@ -0,0 +1,198 @@
+# session.py
+from bisect import bisect_right
+from collections import OrderedDict
+import sys
+import threading
+
+from interpreter import Interpreter
+from lexer import Lexer
+from parser import PrattParser, ProgramNode
+
+MAX_CHECKPOINTS = 32   # 세션 하나가 보관하는 체크포인트의 최대 개수
+MAX_CHECKPOINT_BYTES = 4 * 1024 * 1024   # 세션 하나의 체크포인트가 차지할 수 있는 메모리 (추정치)
+MAX_SESSIONS = 100     # 서버가 기억하는 세션의 최대 개수 (오래 안 쓴 것부터 버림)
+MAX_STORE_BYTES = 128 * 1024 * 1024      # 모든 세션이 차지할 수 있는 메모리 (추정치)
+TREE_BYTES_PER_CHAR = 64   # 원문 한 글자당 ProgramNode(AST)가 차지하는 메모리 (측정값 40~56을 넉넉히)
+MAX_SESSION_ID_LENGTH = 64
+
+
+def common_prefix_length(a, b):
+    """두 문자열의 공통 앞부분 길이. 문자열 슬라이스 비교로 이분 탐색합니다."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def scope_size(scope):
+    """
+    변수 영역 복사본이 차지하는 메모리의 추정치 (바이트).
+    dict 자체와 문자열 값의 크기를 더합니다. 문자열은 다른 체크포인트와 공유될 수 있으므로 넉넉하게 셉니다.
+    """
+    return sys.getsizeof(scope) + sum(sys.getsizeof(value) for value in scope.values() if isinstance(value, str))
+
+
+class Checkpoint:
+    """
+    index번째 문장을 실행하기 직전의 인터프리터 상태.
+    JF 프로그램은 위에서 아래로 한 번씩만 실행되므로, 변수/입력 위치/출력 길이만 있으면
+    그 지점부터 실행을 그대로 이어갈 수 있습니다.
+    """
+    def __init__(self, index, state, output_offset):
+        self.index = index
+        self.state = state                  # Interpreter.snapshot()의 결과
+        self.output_offset = output_offset  # 그때까지 출력된 글자 수
+        self.size = scope_size(state[0])
+
+    @property
+    def input_index(self):
+        return self.state[1]
+
+
+class Session:
+    """이전 실행의 원문과 ProgramNode, 입력, 출력, 체크포인트를 기억하는 편집 세션."""
+    def __init__(self):
+        self.code = ''
+        self.tree = ProgramNode([], [], [])
+        self.inputs = []
+        self.output = ''
+        self.checkpoints = []
+        self.lock = threading.Lock()  # 같은 세션의 요청이 동시에 들어와도 상태가 섞이지 않도록
+
+    def parse(self, code):
+        """
+        code를 파싱합니다. 이전에 실행한 원문과 앞부분이 같다면, 그 안에서 파싱이 끝난 줄들은
+        이전 ProgramNode의 문장을 그대로 쓰고, 그 다음 줄부터만 다시 토큰화/파싱합니다.
+        """
+        same = common_prefix_length(self.code, code)
+        previous = self.tree
+        i = bisect_right(previous.line_starts, (same, float('inf'))) - 1
+        if i <= 0:
+            return PrattParser(Lexer(code)).parse()
+
+        read_end, count, offset = previous.line_starts[i]
+        lexer = Lexer(code, offset)
+        lexer.mark_read(read_end) # 앞부분을 토큰화하며 읽은 범위도 이어서 기록
+        rest = PrattParser(lexer).parse()
+        return ProgramNode(
+            previous.statements[:count] + rest.statements,
+            previous.statement_ends[:count] + rest.statement_ends,
+            previous.line_starts[:i] + [(end, count + index, start) for end, index, start in rest.line_starts],
+        )
+
+    def first_changed_statement(self, code, tree):
+        """
+        이전 프로그램과 처음으로 달라지는 문장의 번호를 찾습니다.
+        AST를 노드 단위로 비교하는 것은 JF 문장을 실행하는 것만큼 느리므로, 대신 원문의 공통 앞부분을
+        구하고, 그 안에서 파싱이 끝난 문장(PrattParser가 기록한 statement_ends 기준)은 같다고 봅니다.
+        """
+        same = common_prefix_length(self.code, code)
+        limit = min(len(self.tree.statement_ends), len(tree.statement_ends))
+        return bisect_right(tree.statement_ends, same, 0, limit)
+
+    def inputs_still_valid(self, checkpoint, inputs):
+        """체크포인트까지 읽은 입력이 새 입력에서도 똑같은지 확인합니다."""
+        k = checkpoint.input_index
+        if self.inputs[:k] != inputs[:k]:
+            return False
+        # 입력을 모두 읽은 상태였다면, 그 뒤의 읽기는 빈 문자열을 받았을 수 있습니다.
+        # 입력 개수가 바뀌었다면 결과가 달라질 수 있으므로 쓰지 않습니다.
+        return k < len(self.inputs) or len(inputs) == len(self.inputs)
+
+    def resume_point(self, code, tree, inputs):
+        """다시 실행을 시작할 수 있는 가장 늦은 체크포인트. 없으면 None."""
+        changed = self.first_changed_statement(code, tree)
+        for checkpoint in reversed(self.checkpoints):
+            if checkpoint.index <= changed and self.inputs_still_valid(checkpoint, inputs):
+                return checkpoint
+        return None
+
+    def checkpoint_bytes(self):
+        return sum(checkpoint.size for checkpoint in self.checkpoints)
+
+    def size(self):
+        """이 세션이 붙잡고 있는 메모리의 추정치 (바이트)."""
+        tree_bytes = len(self.code) * TREE_BYTES_PER_CHAR
+        return sys.getsizeof(self.code) + tree_bytes + sys.getsizeof(self.output) + self.checkpoint_bytes()
+
+    def add_checkpoint(self, checkpoint):
+        """
+        체크포인트를 추가하고, 개수나 크기가 넘치면 하나 걸러 하나씩 버립니다. (가장 최근 것은 유지)
+        하나만 남았는데도 너무 크다면 모두 버립니다. 버린 적이 있으면 True를 돌려줍니다.
+        """
+        self.checkpoints.append(checkpoint)
+        thinned = False
+        while len(self.checkpoints) > MAX_CHECKPOINTS or self.checkpoint_bytes() > MAX_CHECKPOINT_BYTES:
+            thinned = True
+            if len(self.checkpoints) == 1:
+                self.checkpoints.clear()
+                break
+            del self.checkpoints[-2::-2]
+        return thinned
+
+    def run(self, code, tree, inputs, output_buffer):
+        """
+        code를 parse()로 파싱한 tree를 실행합니다. 이전 실행과 앞부분이 같다면 가장 가까운 체크포인트부터 이어서 실행합니다.
+        console.print 출력은 output_buffer에만 쓰므로, 저장되는 출력은 항상 이 프로그램의 것입니다.
+        """
+        statements = tree.statements
+        interpreter = Interpreter(inputs=inputs, output=output_buffer)
+        start = 0
+
+        checkpoint = self.resume_point(code, tree, inputs)
+        if checkpoint is not None:
+            interpreter.restore(checkpoint.state)
+            output_buffer.write(self.output[:checkpoint.output_offset])
+            start = checkpoint.index
+        self.checkpoints = [c for c in self.checkpoints if c.index <= start]
+
+        self.code = code
+        self.tree = tree
+        self.inputs = inputs
+        interval = max(1, len(statements) // MAX_CHECKPOINTS)
+        try:
+            for i in range(start, len(statements)):
+                if i > start and i % interval == 0:
+                    if self.add_checkpoint(Checkpoint(i, interpreter.snapshot(), output_buffer.tell())):
+                        interval *= 2
+                interpreter.visit(statements[i])
+            # 끝까지 실행된 상태도 저장해 두면, 뒤에 문장을 덧붙였을 때 바로 이어갈 수 있습니다.
+            if start < len(statements):
+                self.add_checkpoint(Checkpoint(len(statements), interpreter.snapshot(), output_buffer.tell()))
+        finally:
+            # 체크포인트의 출력 길이는 이 출력을 기준으로 합니다. 오류가 나도 저장해야 합니다.
+            self.output = output_buffer.getvalue()
+
+
+def is_valid_session_id(session_id):
+    """클라이언트가 보낸 세션 ID가 쓸 수 있는 값(너무 길지 않은 문자열)인지 확인합니다."""
+    return isinstance(session_id, str) and 0 < len(session_id) <= MAX_SESSION_ID_LENGTH
+
+
+class SessionStore:
+    """세션 ID -> Session. 최근에 쓴 MAX_SESSIONS개, 합쳐서 MAX_STORE_BYTES 이하만 유지합니다."""
+    def __init__(self, max_sessions=MAX_SESSIONS, max_bytes=MAX_STORE_BYTES):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, session_id):
+        with self.lock:
+            session = self.sessions.pop(session_id, None) or Session()
+            self.sessions[session_id] = session
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+            return session
+
+    def trim(self):
+        """모든 세션의 크기 합이 max_bytes를 넘으면 오래 안 쓴 세션부터 버립니다."""
+        with self.lock:
+            total = sum(session.size() for session in self.sessions.values())
+            while total > self.max_bytes and self.sessions:
+                _, session = self.sessions.popitem(last=False)
+                total -= session.size()
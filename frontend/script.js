@@ -11,6 +11,8 @@ const outputContainer = document.getElementById('output-container');
 
 
 const API_ENDPOINT = 'https://jf-language-online.onrender.com/run';
+// 서버가 이전 실행 결과를 기억해, 바뀐 줄부터 다시 실행할 수 있도록 하는 세션 ID
+const SESSION_ID = crypto.randomUUID();
 
 runButton.addEventListener('click', async () => {
     const code = editor.getValue(); 
@@ -24,7 +26,7 @@ runButton.addEventListener('click', async () => {
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({ code: code, inputs: inputs })
+            body: JSON.stringify({ code: code, inputs: inputs, session_id: SESSION_ID })
         });
 
         const result = await response.json();